@@ -50,6 +50,9 @@ INTERACTIVE = False
 # 4 is a magic number for default and doesn't refer
 # to the actual ruleset 4 in devfs.rules(!)
 IOCAGE_DEVFS_RULESET = 4
+# inet and inet6 addresses as printed by ifconfig, including the prefix
+# length with -f inet:cidr
+INET_ADDRESS_RE = re.compile(r'^\s*inet6? (\S+)', re.MULTILINE)
 
 
 def callback(_log, callback_exception):
@@ -752,7 +755,7 @@ def generate_devfs_ruleset(conf, paths=None, includes=None, callback=None,
         ['devfs', 'rule', 'showsets'],
         stdout=su.PIPE, universal_newlines=True
     )
-    ruleset_list = [int(i) for i in devfs_rulesets.stdout.splitlines()]
+    ruleset_list = {int(i) for i in devfs_rulesets.stdout.splitlines()}
 
     ruleset = int(conf["min_dyn_devfs_ruleset"])
     while ruleset in ruleset_list:
@@ -993,8 +996,8 @@ def boolean_prop_exists(supplied_props, props_to_check):
 def gen_unused_lo_ip():
     """Best effort to try to allocate a localhost IP for a jail"""
     interface_addrs = netifaces.ifaddresses('lo0')
-    inuse = [ip['addr'] for ips in interface_addrs.values() for ip in ips
-             if ip['addr'].startswith('127')]
+    inuse = {ip['addr'] for ips in interface_addrs.values() for ip in ips
+             if ip['addr'].startswith('127')}
 
     for ip in ipaddress.IPv4Network('127.0.0.0/8'):
         ip_exploded = ip.exploded
@@ -1017,7 +1020,7 @@ def gen_unused_lo_ip():
 
 def gen_nat_ip(ip_prefix):
     """Best effort to try to allocate a private NAT IP for a jail"""
-    inuse = get_used_ips()
+    inuse = set(get_used_ips())
 
     for i in range(256):
         for l in range(1, 256, 4):
@@ -1026,7 +1029,7 @@ def gen_nat_ip(ip_prefix):
             )
             pair = [_ip.exploded for _ip in network.hosts()]
 
-            if any(x in pair for x in inuse):
+            if inuse.intersection(pair):
                 continue
 
             return pair
@@ -1049,16 +1052,11 @@ def get_used_ips():
             ['jls', 'jid', '--libxo', 'json'], stdout=su.PIPE, stderr=su.PIPE
         ).stdout
     )['jail-information']['jail']
-    addresses = []
-
     # Host
     inuse = su.run(
         ['ifconfig'], stdout=su.PIPE, stderr=su.PIPE, universal_newlines=True
     )
-    for line in inuse.stdout.splitlines():
-        if line.strip().startswith('inet'):
-            address = line.split()[1]
-            addresses.append(address)
+    addresses = INET_ADDRESS_RE.findall(inuse.stdout)
 
     # Jails
     with concurrent.futures.ThreadPoolExecutor() as exc:
@@ -1070,10 +1068,7 @@ def get_used_ips():
         )
 
         for future in futures:
-            for line in future.stdout.splitlines():
-                if line.strip().startswith('inet'):
-                    address = line.split()[1]
-                    addresses.append(address)
+            addresses.extend(INET_ADDRESS_RE.findall(future.stdout))
 
     return addresses
 
@@ -161,10 +161,13 @@ class JailRuntimeConfiguration(object):
                 write_data.append(f'{key} = "{value}";')
 
         config_params = '\n\t'.join(write_data)
-        with open(self.path, 'w') as f:
-            f.write(
-                f'"{self.name}" {{\n\t{config_params}\n}}\n'
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(
+                fd, f'"{self.name}" {{\n\t{config_params}\n}}\n'.encode()
             )
+        finally:
+            os.close(fd)
 
 
 class IOCCpuset(object):
@@ -268,14 +271,14 @@ class IOCCpuset(object):
 
 class IOCRCTL(object):
 
-    types = {
+    types = frozenset({
         'cputime', 'datasize', 'stacksize', 'coredumpsize',
         'memoryuse', 'memorylocked', 'maxproc', 'openfiles',
         'vmemoryuse', 'pseudoterminals', 'swapuse', 'nthr',
         'msgqqueued', 'msgqsize', 'nmsgq', 'nsem', 'nsemop',
         'nshm', 'shmsize', 'wallclock', 'pcpu', 'readbps',
         'writebps', 'readiops', 'writeiops'
-    }
+    })
 
     def __init__(self, name):
         self.jail_name = f'ioc-{name}'
@@ -600,13 +603,9 @@ class IOCConfiguration:
         # that this mac is being used in a local network which we set it
         # always.
         if not IOCConfiguration.validate_mac_prefix(mac_prefix):
-            # First and second bits in the first byte will be at
-            # 7th and 6th indexes respectively as networks are
-            # MSB-LTR ordered
-            binary = list(format(int(mac_prefix, 16), '024b'))
-            binary[6] = '1'
-            binary[7] = '0'
-            mac_prefix = format(int(''.join(binary), 2), '06x')
+            # First and second bits in the first byte are the two lowest
+            # bits of the first octet of the 24 bit prefix
+            mac_prefix = f'{(int(mac_prefix, 16) & ~0x010000) | 0x020000:06x}'
 
         return mac_prefix
 
@@ -614,8 +613,7 @@ class IOCConfiguration:
     def validate_mac_prefix(mac_prefix):
         valid = len(mac_prefix) == 6
         if valid:
-            binary = format(int(mac_prefix, 16), '024b')
-            valid = binary[7] == '0' and binary[6] == '1'
+            valid = (int(mac_prefix, 16) >> 16) & 0b11 == 0b10
         return valid
 
     def json_write(self, data, _file="/config.json", defaults=False):
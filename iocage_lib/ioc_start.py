@@ -22,15 +22,21 @@
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 """This is responsible for starting jails."""
+import concurrent.futures
 import datetime
+import functools
 import hashlib
 import os
 import re
 import fcntl
+import shlex
 import itertools
 import shutil
+import signal
+import stat
 import json
 import subprocess as su
+import threading
 import netifaces
 import ipaddress
 import logging
@@ -42,6 +48,89 @@ import iocage_lib.ioc_list
 import iocage_lib.ioc_stop
 import iocage_lib.ioc_exceptions as ioc_exceptions
 
+# jail(8) parameters passed through from the jail configuration unchanged
+STATIC_JAIL_PARAMETERS = (
+    ('allow.set_hostname', 'allow_set_hostname'),
+    ('mount.devfs', 'mount_devfs'),
+    ('allow.raw_sockets', 'allow_raw_sockets'),
+    ('allow.sysvipc', 'allow_sysvipc'),
+    ('allow.quotas', 'allow_quotas'),
+    ('allow.socket_af', 'allow_socket_af'),
+    ('allow.chflags', 'allow_chflags'),
+    ('allow.mount.devfs', 'allow_mount_devfs'),
+    ('allow.mount.nullfs', 'allow_mount_nullfs'),
+    ('allow.mount.procfs', 'allow_mount_procfs'),
+)
+
+# Member interfaces as printed by ifconfig for a bridge
+BRIDGE_MEMBER_RE = re.compile(r'^\s*member: (\S+)', re.MULTILINE)
+
+
+def spawn(cmd):
+    """
+    Runs cmd inheriting our stdout and stderr and returns its exit status.
+    posix_spawn avoids duplicating our address space for every short lived
+    helper such as mount.
+    """
+    if not hasattr(os, 'posix_spawnp'):
+        return su.run(cmd).returncode
+
+    # Python ignores these, reset them like subprocess' restore_signals
+    pid = os.posix_spawnp(
+        cmd[0], cmd, os.environ, setsigdef=(signal.SIGPIPE, signal.SIGXFSZ)
+    )
+    _, status = os.waitpid(pid, 0)
+
+    return os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+
+
+def enabled_jail_parameters(parameters):
+    """
+    Renders the (parameter, value) pairs whose value is exactly 1, None
+    entries stand for parameters the host doesn't support.
+    """
+    return [
+        f'{param}={value}' for param, value in filter(None, parameters)
+        if str(value) == '1'
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def jail_param_support():
+    """
+    Returns which version gated jail(8) parameters the host supports, the
+    host version can't change for the lifetime of the process.
+    """
+    userland_version = float(os.uname()[2].partition("-")[0])
+
+    return {
+        # FreeBSD 9.3 and under do not support this.
+        'tmpfs': userland_version > 9.3,
+        # FreeBSD 10.3 and under do not support this.
+        'sysv': userland_version > 10.3,
+        # FreeBSD before 12.0 does not support this.
+        'mlock': userland_version >= 12.0,
+    }
+
+
+# Plugin manifests keyed by path, holding the mtime they were read at
+_plugin_manifests = {}
+
+
+def load_plugin_manifest(path):
+    """
+    Returns the parsed plugin manifest at path, only re-reading it when
+    it has been modified since it was last loaded.
+    """
+    mtime = os.stat(path).st_mtime
+    cached = _plugin_manifests.get(path)
+
+    if cached is None or cached[0] != mtime:
+        with open(path, 'r') as f:
+            cached = _plugin_manifests[path] = (mtime, json.load(f))
+
+    return cached[1]
+
 
 class IOCStart(object):
 
@@ -57,6 +146,7 @@ class IOCStart(object):
     ):
         self.jail_uuid = uuid
         self.uuid = uuid.replace(".", "_")
+        self.jail_name = f'ioc-{self.uuid}'
         self.path = path
         self.callback = callback
         self.silent = silent
@@ -68,16 +158,35 @@ class IOCStart(object):
         self.defaultrouter6 = 'auto'
         self.log = logging.getLogger('iocage')
         self.used_ports = used_ports or []
+        # Addresses configured on the host, keyed by inet mode
+        self.host_ips = {}
+        self._host_interface_names = None
+        self._host_interface_addresses = {}
+        self._vnet_default_interface = None
+        # Members of the bridges we attach to, keyed by bridge
+        self.bridge_members = {}
+        self.bridge_mtus = {}
+        # Serializes config writes and bridge changes between NICs
+        self.network_lock = threading.Lock()
+        self.wants_dhcp = False
 
         if not self.unit_test:
-            self.conf = iocage_lib.ioc_json.IOCJson(path).json_get_value('all')
-            self.pool = iocage_lib.ioc_json.IOCJson(" ").json_get_value("pool")
-            self.iocroot = iocage_lib.ioc_json.IOCJson(
-                self.pool).json_get_value("iocroot")
-            self.get = iocage_lib.ioc_json.IOCJson(self.path,
-                                                   silent=True).json_get_value
-            self.set = iocage_lib.ioc_json.IOCJson(self.path,
-                                                   silent=True).json_set_value
+            self._json = iocage_lib.ioc_json.IOCJson(path)
+            self.conf = self._json.json_get_value('all')
+            self.pool = self._json.pool
+            self.iocroot = self._json.iocroot
+            # Loading the configuration above is allowed to be verbose,
+            # property changes made while starting are not.
+            self._json.silent = True
+
+            # Flags handed to jail(8) as configured, only when enabled
+            self.static_parameters = enabled_jail_parameters(
+                (param, self.conf[key])
+                for param, key in STATIC_JAIL_PARAMETERS
+            )
+            self.wants_dhcp = bool(
+                self.conf['dhcp'] or 'DHCP' in self.conf['ip4_addr'].upper()
+            )
 
             self.exec_fib = self.conf["exec_fib"]
             try:
@@ -86,6 +195,65 @@ class IOCStart(object):
                 if not suppress_exception:
                     raise e
 
+    def get(self, prop):
+        """
+        Returns the value of prop, served from the configuration loaded
+        when the jail was started instead of re-reading config.json.
+        """
+        try:
+            return self.conf[prop]
+        except KeyError:
+            return self._json.json_get_value(prop)
+
+    def set(self, prop):
+        """
+        Sets prop for the jail and keeps the loaded configuration in sync.
+        """
+        self._json.json_set_value(prop)
+
+        key, _, value = prop.partition('=')
+        if key in iocage_lib.ioc_json.IOCJson.truthy_props:
+            value = iocage_lib.ioc_common.check_truthy(value)
+
+        self.conf[key] = value
+
+    @property
+    def host_interface_names(self):
+        """
+        The names of the host's interfaces, listed once per start.
+        """
+        if self._host_interface_names is None:
+            self._host_interface_names = frozenset(netifaces.interfaces())
+
+        return self._host_interface_names
+
+    def host_interface_addresses(self, interface):
+        """
+        The addresses of a host interface, looked up once per start and
+        only for the interfaces we are actually interested in.
+        """
+        addresses = self._host_interface_addresses.get(interface)
+        if addresses is None:
+            addresses = self._host_interface_addresses[interface] = \
+                netifaces.ifaddresses(interface)
+
+        return addresses
+
+    @property
+    def vnet_default_interface(self):
+        """
+        vnet_default_interface with "auto" resolved to the host's default
+        interface.
+        """
+        if self._vnet_default_interface is None:
+            interface = self.get('vnet_default_interface')
+            if interface == 'auto':
+                interface = self.get_default_interface()
+
+            self._vnet_default_interface = interface
+
+        return self._vnet_default_interface
+
     def __start_jail__(self):
         """
         Takes a UUID, and the user supplied name of a jail, the path and the
@@ -97,8 +265,11 @@ class IOCStart(object):
         specified data that is meant to populate resolv.conf
         will be copied into the jail.
         """
+        c = self.conf
+        vnet = c['vnet']
+        jail_zfs = c['jail_zfs']
         status, _ = iocage_lib.ioc_list.IOCList().list_get_jid(self.uuid)
-        userland_version = float(os.uname()[2].partition("-")[0])
+        supports = jail_param_support()
 
         # If the jail is not running, let's do this thing.
 
@@ -112,10 +283,13 @@ class IOCStart(object):
                 silent=self.silent,
                 exception=ioc_exceptions.JailRunning)
 
-        if self.conf['hostid_strict_check']:
-            with open("/etc/hostid", "r") as _file:
-                hostid = _file.read().strip()
-            if self.conf["hostid"] != hostid:
+        if c['hostid_strict_check']:
+            fd = os.open('/etc/hostid', os.O_RDONLY)
+            try:
+                hostid = os.read(fd, 64).strip()
+            finally:
+                os.close(fd)
+            if c["hostid"].encode() != hostid:
                 iocage_lib.ioc_common.logit({
                     "level": "ERROR",
                     "message": f"{self.uuid} hostid is not matching and"
@@ -124,58 +298,78 @@ class IOCStart(object):
                 }, _callback=self.callback, silent=self.silent)
                 return
 
-        mount_procfs = self.conf["mount_procfs"]
-        host_domainname = self.conf["host_domainname"]
-        host_hostname = self.conf["host_hostname"]
-        securelevel = self.conf["securelevel"]
-        enforce_statfs = self.conf["enforce_statfs"]
-        children_max = self.conf["children_max"]
-        allow_set_hostname = self.conf["allow_set_hostname"]
-        allow_sysvipc = self.conf["allow_sysvipc"]
-        allow_raw_sockets = self.conf["allow_raw_sockets"]
-        allow_chflags = self.conf["allow_chflags"]
-        allow_mlock = self.conf["allow_mlock"]
-        allow_mount = self.conf["allow_mount"]
-        allow_mount_devfs = self.conf["allow_mount_devfs"]
-        allow_mount_fusefs = self.conf["allow_mount_fusefs"]
-        allow_mount_nullfs = self.conf["allow_mount_nullfs"]
-        allow_mount_procfs = self.conf["allow_mount_procfs"]
-        allow_mount_tmpfs = self.conf["allow_mount_tmpfs"]
-        allow_mount_zfs = self.conf["allow_mount_zfs"]
-        allow_quotas = self.conf["allow_quotas"]
-        allow_socket_af = self.conf["allow_socket_af"]
-        allow_vmm = self.conf["allow_vmm"]
-        exec_prestart = self.conf["exec_prestart"]
-        exec_poststart = self.conf["exec_poststart"]
-        exec_clean = self.conf["exec_clean"]
-        exec_created = self.conf["exec_created"]
-        exec_timeout = self.conf["exec_timeout"]
-        stop_timeout = self.conf["stop_timeout"]
-        mount_devfs = self.conf["mount_devfs"]
-        mount_fdescfs = self.conf["mount_fdescfs"]
-        sysvmsg = self.conf["sysvmsg"]
-        sysvsem = self.conf["sysvsem"]
-        sysvshm = self.conf["sysvshm"]
-        bpf = self.conf["bpf"]
-        dhcp = self.conf["dhcp"]
-        rtsold = self.conf['rtsold']
-        self.ip4_addr = self.conf['ip4_addr']
-        self.ip6_addr = self.conf["ip6_addr"]
-        wants_dhcp = True if dhcp or 'DHCP' in self.ip4_addr.upper() else False
-        vnet_interfaces = self.conf["vnet_interfaces"]
-        nat = self.conf['nat']
-        nat_interface = self.conf['nat_interface']
-        nat_backend = self.conf['nat_backend']
-        nat_forwards = self.conf['nat_forwards']
-        ip_hostname = self.conf['ip_hostname']
-        prop_missing = False
-        prop_missing_msgs = []
+        mount_procfs = c["mount_procfs"]
+        host_domainname = c["host_domainname"]
+        host_hostname = c["host_hostname"]
+        securelevel = c["securelevel"]
+        enforce_statfs = c["enforce_statfs"]
+        children_max = c["children_max"]
+        allow_mlock = c["allow_mlock"]
+        allow_mount = c["allow_mount"]
+        allow_mount_fusefs = c["allow_mount_fusefs"]
+        allow_mount_tmpfs = c["allow_mount_tmpfs"]
+        allow_mount_zfs = c["allow_mount_zfs"]
+        allow_vmm = c["allow_vmm"]
+        exec_prestart = c["exec_prestart"]
+        exec_poststart = c["exec_poststart"]
+        exec_clean = c["exec_clean"]
+        exec_created = c["exec_created"]
+        exec_timeout = c["exec_timeout"]
+        stop_timeout = c["stop_timeout"]
+        mount_fdescfs = c["mount_fdescfs"]
+        sysvmsg = c["sysvmsg"]
+        sysvsem = c["sysvsem"]
+        sysvshm = c["sysvshm"]
+        bpf = c["bpf"]
+        rtsold = c['rtsold']
+        self.ip4_addr = c['ip4_addr']
+        self.ip6_addr = c["ip6_addr"]
+        vnet_interfaces = c["vnet_interfaces"]
+        vnet_interfaces = vnet_interfaces.split() \
+            if vnet_interfaces != 'none' else ()
+        jail_zfs_datasets = tuple(
+            f'{self.pool}/{d.strip()}' for d in c['jail_zfs_dataset'].split()
+        ) if jail_zfs else ()
+        nat = c['nat']
+        nat_interface = c['nat_interface']
+        nat_backend = c['nat_backend']
+        nat_forwards = c['nat_forwards']
+        ip_hostname = c['ip_hostname']
         debug_mode = True if os.environ.get(
             'IOCAGE_DEBUG', 'FALSE') == 'TRUE' else False
-        assign_localhost = self.conf['assign_localhost']
-        localhost_ip = self.conf['localhost_ip']
-        self.defaultrouter = self.conf['defaultrouter']
-        self.defaultrouter6 = self.conf['defaultrouter6']
+        assign_localhost = c['assign_localhost']
+        localhost_ip = c['localhost_ip']
+        self.defaultrouter = c['defaultrouter']
+        self.defaultrouter6 = c['defaultrouter6']
+
+        # Refuse misconfigured jails before doing any real work
+        prop_missing_msgs = []
+
+        if self.wants_dhcp:
+            if not bpf:
+                prop_missing_msgs.append(
+                    f"{self.uuid}: dhcp requires bpf!"
+                )
+            elif not vnet:
+                prop_missing_msgs.append(
+                    f"{self.uuid}: dhcp requires vnet!"
+                )
+
+        if 'accept_rtadv' in self.ip6_addr and not vnet:
+            prop_missing_msgs.append(
+                f'{self.uuid}: accept_rtadv requires vnet!'
+            )
+
+        if bpf and not vnet:
+            prop_missing_msgs.append(f'{self.uuid}: bpf requires vnet!')
+
+        if prop_missing_msgs:
+            iocage_lib.ioc_common.logit({
+                "level": "EXCEPTION",
+                "message": '\n'.join(prop_missing_msgs)
+            }, _callback=self.callback,
+                silent=self.silent)
+
         self.host_gateways = iocage_lib.ioc_common.get_host_gateways()
 
         fstab_list = []
@@ -191,19 +385,6 @@ class IOCStart(object):
             'list'
         ).__validate_fstab__(fstab_list, 'all')
 
-        if wants_dhcp:
-            if not bpf:
-                prop_missing_msgs.append(
-                    f"{self.uuid}: dhcp requires bpf!"
-                )
-                prop_missing = True
-            elif not self.conf['vnet']:
-                # We are already setting a vnet variable below.
-                prop_missing_msgs.append(
-                    f"{self.uuid}: dhcp requires vnet!"
-                )
-                prop_missing = True
-
         if nat and nat_forwards != 'none':
             # If NAT is enabled and nat port forwarding as well,
             # we want to make sure that the current jail's port forwarding
@@ -235,7 +416,7 @@ class IOCStart(object):
         if nat and nat_interface == 'none':
             self.log.debug('Grabbing default route\'s interface')
             nat_interface = self.get_default_interface()
-            self.log.debug(f'Interface: {nat_interface}')
+            self.log.debug('Interface: %s', nat_interface)
 
             iocage_lib.ioc_common.logit({
                 'level': 'WARNING',
@@ -244,104 +425,88 @@ class IOCStart(object):
             }, _callback=self.callback,
                 silent=self.silent)
 
-        if self.conf['vnet'] and self.defaultrouter == 'auto':
+        if vnet and self.defaultrouter == 'auto':
             self.log.debug('Grabbing IPv4 default route')
             self.defaultrouter = self.get_default_gateway('ipv4')
-            self.log.debug(f'Default IPv4 Gateway: {self.defaultrouter}')
+            self.log.debug('Default IPv4 Gateway: %s', self.defaultrouter)
 
-        if self.conf['vnet'] and self.defaultrouter6 == 'auto':
+        if vnet and self.defaultrouter6 == 'auto':
             self.log.debug('Grabbing IPv6 default route')
             self.defaultrouter6 = self.get_default_gateway('ipv6')
-            self.log.debug(f'Default IPv6 Gateway: {self.defaultrouter6}')
-
-        if 'accept_rtadv' in self.ip6_addr and not self.conf['vnet']:
-            prop_missing_msgs.append(
-                f'{self.uuid}: accept_rtadv requires vnet!'
-            )
-            prop_missing = True
-
-        if bpf and not self.conf['vnet']:
-            prop_missing_msgs.append(f'{self.uuid}: bpf requires vnet!')
-            prop_missing = True
-
-        if prop_missing:
-            iocage_lib.ioc_common.logit({
-                "level": "EXCEPTION",
-                "message": '\n'.join(prop_missing_msgs)
-            }, _callback=self.callback,
-                silent=self.silent)
+            self.log.debug('Default IPv6 Gateway: %s', self.defaultrouter6)
 
-        self.__check_dhcp_or_accept_rtadv__(ipv4=True, enable=wants_dhcp)
+        rc_conf_changes = self.__check_dhcp_or_accept_rtadv__(
+            ipv4=True, enable=self.wants_dhcp
+        )
 
         if rtsold:
-            self.__check_rtsold__()
+            rc_conf_changes.update(self.__check_rtsold__())
 
-        self.__check_dhcp_or_accept_rtadv__(ipv4=False, enable='accept_rtadv' in self.ip6_addr)
+        rc_conf_changes.update(self.__check_dhcp_or_accept_rtadv__(
+            ipv4=False, enable='accept_rtadv' in self.ip6_addr
+        ))
+        self.__update_rc_conf__(rc_conf_changes)
 
         if mount_procfs:
-            su.Popen(
+            spawn(
                 [
                     'mount', '-t', 'procfs', 'proc', f'{self.path}/root/proc'
                 ]
-            ).communicate()
+            )
 
         try:
-            mount_linprocfs = self.conf["mount_linprocfs"]
+            mount_linprocfs = c["mount_linprocfs"]
 
             if mount_linprocfs:
                 if not os.path.isdir(f"{self.path}/root/compat/linux/proc"):
                     os.makedirs(f"{self.path}/root/compat/linux/proc", 0o755)
-                su.Popen(
+                spawn(
                     [
                         'mount', '-t', 'linprocfs', 'linproc',
                         f'{self.path}/root/compat/linux/proc'
                     ]
-                ).communicate()
+                )
         except Exception:
             pass
 
-        if self.conf['jail_zfs']:
+        if jail_zfs:
             allow_mount = "1"
             enforce_statfs = enforce_statfs if enforce_statfs != "2" \
                 else "1"
             allow_mount_zfs = "1"
 
-            for jdataset in self.conf["jail_zfs_dataset"].split():
-                jdataset = jdataset.strip()
+            # A single zfs get tells us which datasets already exist,
+            # missing ones are simply absent from its output.
+            existing = set(su.run(
+                ['zfs', 'get', '-H', '-o', 'name', 'creation',
+                 *jail_zfs_datasets], stdout=su.PIPE, stderr=su.DEVNULL
+            ).stdout.decode().split())
 
-                try:
-                    su.check_call(["zfs", "get", "-H", "creation",
-                                   f"{self.pool}/{jdataset}"],
-                                  stdout=su.PIPE, stderr=su.PIPE)
-                except su.CalledProcessError:
+            for jdataset in jail_zfs_datasets:
+                if jdataset not in existing:
                     iocage_lib.ioc_common.checkoutput(
                         ["zfs", "create", "-o",
                          "compression=lz4", "-o",
                          "mountpoint=none",
-                         f"{self.pool}/{jdataset}"],
+                         jdataset],
                         stderr=su.STDOUT)
 
-                try:
-                    iocage_lib.ioc_common.checkoutput(
-                        ["zfs", "set", "jailed=on",
-                         f"{self.pool}/{jdataset}"],
-                        stderr=su.STDOUT)
-                except su.CalledProcessError as err:
-                    raise RuntimeError(
-                        f"{err.output.decode('utf-8').rstrip()}")
-
-        # FreeBSD 9.3 and under do not support this.
+            try:
+                iocage_lib.ioc_common.checkoutput(
+                    ["zfs", "set", "jailed=on", *jail_zfs_datasets],
+                    stderr=su.STDOUT)
+            except su.CalledProcessError as err:
+                raise RuntimeError(
+                    f"{err.output.decode('utf-8').rstrip()}")
 
-        if userland_version <= 9.3:
-            tmpfs = ""
-            fdescfs = ""
+        if not supports['tmpfs']:
+            tmpfs = None
+            fdescfs = None
         else:
-            tmpfs = f"allow.mount.tmpfs={allow_mount_tmpfs}"
-            fdescfs = f"mount.fdescfs={mount_fdescfs}"
-
-        # FreeBSD 10.3 and under do not support this.
+            tmpfs = ('allow.mount.tmpfs', allow_mount_tmpfs)
+            fdescfs = ('mount.fdescfs', mount_fdescfs)
 
-        if userland_version <= 10.3:
+        if not supports['sysv']:
             _sysvmsg = ""
             _sysvsem = ""
             _sysvshm = ""
@@ -350,44 +515,42 @@ class IOCStart(object):
             _sysvsem = f"sysvsem={sysvsem}"
             _sysvshm = f"sysvshm={sysvshm}"
 
-        # FreeBSD before 12.0 does not support this.
-
-        if userland_version < 12.0:
-            _allow_mlock = ''
-            _allow_mount_fusefs = ''
-            _allow_vmm = ''
+        if not supports['mlock']:
+            _allow_mlock = None
+            _allow_mount_fusefs = None
+            _allow_vmm = None
             _exec_created = ''
         else:
-            _allow_mlock = f"allow.mlock={allow_mlock}"
-            _allow_mount_fusefs = f"allow.mount.fusefs={allow_mount_fusefs}"
-            _allow_vmm = f"allow.vmm={allow_vmm}"
+            _allow_mlock = ('allow.mlock', allow_mlock)
+            _allow_mount_fusefs = ('allow.mount.fusefs', allow_mount_fusefs)
+            _allow_vmm = ('allow.vmm', allow_vmm)
             _exec_created = f'exec.created={exec_created}'
 
         if nat:
-            self.log.debug(f'Checking NAT backend: {nat_backend}')
+            self.log.debug('Checking NAT backend: %s', nat_backend)
             self.__check_nat__(backend=nat_backend)
 
-            if not self.conf['vnet']:
+            if not vnet:
                 self.log.debug('VNET is False')
                 self.log.debug(
-                    f'Generating IP from nat_prefix: {self.conf["nat_prefix"]}'
+                    'Generating IP from nat_prefix: %s', c['nat_prefix']
                 )
                 ip4_addr, _ = iocage_lib.ioc_common.gen_nat_ip(
-                    self.conf['nat_prefix']
+                    c['nat_prefix']
                 )
                 self.ip4_addr = f'{nat_interface}|{ip4_addr}'
                 # Make this reality for list
                 self.set(f'ip4_addr={self.ip4_addr}')
-                self.log.debug(f'Received ip4_addr: {self.ip4_addr}')
+                self.log.debug('Received ip4_addr: %s', self.ip4_addr)
             else:
                 self.log.debug('VNET is True')
                 self.log.debug(
-                    f'Generating default_router and IP from nat_prefix:'
-                    f' {self.conf["nat_prefix"]}'
+                    'Generating default_router and IP from nat_prefix: %s',
+                    c['nat_prefix']
                 )
                 self.defaultrouter, ip4_addr = \
                     iocage_lib.ioc_common.gen_nat_ip(
-                        self.conf['nat_prefix']
+                        c['nat_prefix']
                     )
                 self.ip4_addr = f'vnet0|{ip4_addr}/30'
                 # Make this reality for list
@@ -395,14 +558,14 @@ class IOCStart(object):
                 nat = self.defaultrouter
                 # Make this reality for list
                 self.set(f'defaultrouter={self.defaultrouter}')
-                self.log.debug(f'Received default_router: {nat}')
-                self.log.debug(f'Received ip4_addr: {self.ip4_addr}')
-
-        if not self.conf['vnet']:
-            ip4_saddrsel = self.conf['ip4_saddrsel']
-            ip4 = self.conf['ip4']
-            ip6_saddrsel = self.conf['ip6_saddrsel']
-            ip6 = self.conf['ip6']
+                self.log.debug('Received default_router: %s', nat)
+                self.log.debug('Received ip4_addr: %s', self.ip4_addr)
+
+        if not vnet:
+            ip4_saddrsel = c['ip4_saddrsel']
+            ip4 = c['ip4']
+            ip6_saddrsel = c['ip6_saddrsel']
+            ip6 = c['ip6']
             net = []
 
             if assign_localhost:
@@ -426,6 +589,7 @@ class IOCStart(object):
 
                 if self.check_aliases(localhost_ip, '4') != localhost_ip:
                     su.run(['ifconfig', 'lo0', 'alias', f'{localhost_ip}/32'])
+                    self.host_ips['4'].add(localhost_ip)
                 else:
                     active_jail_ips = json.loads(su.run(
                         ['jls', '-n', 'ip4.addr', '--libxo=json'],
@@ -465,18 +629,10 @@ class IOCStart(object):
                 f'ip6.saddrsel={ip6_saddrsel}',
                 f'ip6={ip6}'
             ]
-
-            vnet = False
         else:
-            net = ["vnet"]
-
-            if vnet_interfaces != "none":
-                for vnet_int in vnet_interfaces.split():
-                    net += [f"vnet.interface={vnet_int}"]
-            else:
-                vnet_interfaces = ""
-
-            vnet = True
+            net = ["vnet"] + [
+                f"vnet.interface={vnet_int}" for vnet_int in vnet_interfaces
+            ]
 
         msg = f"* Starting {self.uuid}"
         iocage_lib.ioc_common.logit({
@@ -489,10 +645,9 @@ class IOCStart(object):
         devfs_paths = None
         devfs_includes = None
 
-        manifest_path = os.path.join(self.path, f'{self.conf["plugin_name"]}.json')
-        if self.conf['type'] == 'pluginv2' and os.path.isfile(manifest_path):
-            with open(manifest_path, 'r') as f:
-                devfs_json = json.load(f)
+        manifest_path = os.path.join(self.path, f'{c["plugin_name"]}.json')
+        if c['type'] == 'pluginv2' and os.path.isfile(manifest_path):
+            devfs_json = load_plugin_manifest(manifest_path)
             iocage_lib.ioc_common.validate_plugin_manifest(devfs_json, self.callback, self.silent)
             devfs_paths = devfs_json.get('devfs_ruleset', {}).get('paths')
             devfs_includes = devfs_json.get('devfs_ruleset', {}).get('includes')
@@ -500,7 +655,7 @@ class IOCStart(object):
         # Generate dynamic devfs ruleset from configured one
         (manual_devfs_config, configured_devfs_ruleset, devfs_ruleset) \
             = iocage_lib.ioc_common.generate_devfs_ruleset(
-                self.conf, devfs_paths, devfs_includes)
+                c, devfs_paths, devfs_includes)
 
         if int(devfs_ruleset) < 0:
             iocage_lib.ioc_common.logit({
@@ -527,7 +682,7 @@ class IOCStart(object):
                     _callback=self.callback,
                     silent=self.silent)
 
-            if wants_dhcp and self.conf['type'] != 'pluginv2':
+            if self.wants_dhcp and c['type'] != 'pluginv2':
                 iocage_lib.ioc_common.logit({
                     "level": "WARNING",
                     "message": f"  {self.uuid} is not using the devfs_ruleset"
@@ -539,28 +694,20 @@ class IOCStart(object):
                     _callback=self.callback,
                     silent=self.silent)
 
+        # These are only passed to jail(8) when enabled
         parameters = [
             fdescfs, _allow_mlock, tmpfs,
             _allow_mount_fusefs, _allow_vmm,
-            f"allow.set_hostname={allow_set_hostname}",
-            f"mount.devfs={mount_devfs}",
-            f"allow.raw_sockets={allow_raw_sockets}",
-            f"allow.sysvipc={allow_sysvipc}",
-            f"allow.quotas={allow_quotas}",
-            f"allow.socket_af={allow_socket_af}",
-            f"allow.chflags={allow_chflags}",
-            f"allow.mount={allow_mount}",
-            f"allow.mount.devfs={allow_mount_devfs}",
-            f"allow.mount.nullfs={allow_mount_nullfs}",
-            f"allow.mount.procfs={allow_mount_procfs}",
-            f"allow.mount.zfs={allow_mount_zfs}"
+            ('allow.mount', allow_mount),
+            ('allow.mount.zfs', allow_mount_zfs)
         ]
 
-        start_parameters = [
-            x for x in net
-            + [x for x in parameters if '1' in x]
-            + [
-                f'name=ioc-{self.uuid}',
+        start_parameters = list(filter(None, itertools.chain(
+            net,
+            self.static_parameters,
+            enabled_jail_parameters(parameters),
+            [
+                f'name={self.jail_name}',
                 _sysvmsg,
                 _sysvsem,
                 _sysvshm,
@@ -578,11 +725,12 @@ class IOCStart(object):
                 f'stop.timeout={stop_timeout}',
                 f'mount.fstab={self.path}/fstab',
                 'allow.dying',
-                f'exec.consolelog={self.iocroot}/log/ioc-'
-                f'{self.uuid}-console.log',
+                f'exec.consolelog={self.iocroot}/log/'
+                f'{self.jail_name}-console.log',
                 f'ip_hostname={ip_hostname}' if ip_hostname else '',
                 'persist'
-            ] if x != '']
+            ]
+        )))
 
         # Write the config out to a file. We'll be starting the jail using this
         # config and it is required for stopping the jail too.
@@ -596,12 +744,12 @@ class IOCStart(object):
         if debug_mode:
             start_cmd.append('-v')
 
-        start_cmd += ['-f', f'/var/run/jail.ioc-{self.uuid}.conf', '-c']
+        start_cmd += ['-f', f'/var/run/jail.{self.jail_name}.conf', '-c']
 
         start_env = {
             **os.environ,
             "IOCAGE_HOSTNAME": f"{host_hostname}",
-            "IOCAGE_NAME": f"ioc-{self.uuid}",
+            "IOCAGE_NAME": self.jail_name,
         }
 
         if nat:
@@ -617,7 +765,7 @@ class IOCStart(object):
             }
             default_gw_iface = self.host_gateways['ipv4']['interface']
             if default_gw_iface:
-                gw_addresses = netifaces.ifaddresses(
+                gw_addresses = self.host_interface_addresses(
                     default_gw_iface
                 )[netifaces.AF_INET]
                 if gw_addresses:
@@ -748,54 +896,58 @@ class IOCStart(object):
                 _callback=self.callback,
                 silent=self.silent)
 
-        if self.conf['jail_zfs']:
-            for jdataset in self.conf["jail_zfs_dataset"].split():
-                jdataset = jdataset.strip()
-                children = iocage_lib.ioc_common.checkoutput(
-                    ["zfs", "list", "-H", "-r", "-o",
-                     "name", "-s", "name",
-                     f"{self.pool}/{jdataset}"])
-
+        if jail_zfs:
+            # Every child and its mountpoint in one pass, sorted on name so
+            # parents are mounted before their children.
+            children = {}
+            for line in iocage_lib.ioc_common.checkoutput(
+                ["zfs", "list", "-H", "-r", "-o",
+                 "name,mountpoint", "-s", "name", *jail_zfs_datasets]
+            ).splitlines():
+                child, mountpoint = line.split('\t')
+                children[child] = mountpoint
+
+            for jdataset in jail_zfs_datasets:
                 try:
                     iocage_lib.ioc_common.checkoutput(
-                        ["zfs", "jail", "ioc-{}".format(self.uuid),
-                         "{}/{}".format(self.pool, jdataset)],
+                        ["zfs", "jail", self.jail_name, jdataset],
                         stderr=su.STDOUT)
                 except su.CalledProcessError as err:
                     raise RuntimeError(
                         f"{err.output.decode('utf-8').rstrip()}")
 
-                for child in children.split():
-                    child = child.strip()
-
-                    try:
-                        mountpoint = iocage_lib.ioc_common.checkoutput(
-                            ["zfs", "get", "-H",
-                             "-o",
-                             "value", "mountpoint",
-                             f"{self.pool}/{jdataset}"]).strip()
+            # Whether children get mounted is decided by the mountpoint of
+            # the jailed dataset they belong to, not their own.
+            mounts = [
+                f'zfs mount {shlex.quote(child)}'
+                for jdataset in jail_zfs_datasets
+                if children[jdataset] != 'none'
+                for child in children
+                if child == jdataset or child.startswith(f'{jdataset}/')
+            ]
 
-                        if mountpoint != "none":
-                            iocage_lib.ioc_common.checkoutput(
-                                ["setfib", self.exec_fib, "jexec",
-                                 f"ioc-{self.uuid}", "zfs",
-                                 "mount", child], stderr=su.STDOUT)
-                    except su.CalledProcessError as err:
-                        msg = err.output.decode('utf-8').rstrip()
-                        iocage_lib.ioc_common.logit({
-                            "level": "EXCEPTION",
-                            "message": msg
-                        },
-                            _callback=self.callback,
-                            silent=self.silent)
+            if mounts:
+                try:
+                    iocage_lib.ioc_common.checkoutput(
+                        ["setfib", self.exec_fib, "jexec",
+                         self.jail_name, "sh", "-c",
+                         ' && '.join(mounts)], stderr=su.STDOUT)
+                except su.CalledProcessError as err:
+                    msg = err.output.decode('utf-8').rstrip()
+                    iocage_lib.ioc_common.logit({
+                        "level": "EXCEPTION",
+                        "message": msg
+                    },
+                        _callback=self.callback,
+                        silent=self.silent)
 
         self.start_generate_resolv()
         self.start_copy_localtime()
 
         if nat:
             self.log.debug(
-                f'Adding NAT: Interface - {nat_interface}'
-                f' Forwards - {nat_forwards} Backend - {nat_backend}'
+                'Adding NAT: Interface - %s Forwards - %s Backend - %s',
+                nat_interface, nat_forwards, nat_backend
             )
             # We use a lock here to ensure that two jails at the same
             # time do not attempt to write nat rules
@@ -805,57 +957,59 @@ class IOCStart(object):
                 self.__add_nat__(nat_interface, nat_forwards, nat_backend)
 
         # This needs to be a list.
-        exec_start = self.conf['exec_start'].split()
+        exec_start = c['exec_start'].split()
 
-        with open(
-            f'{self.iocroot}/log/{self.uuid}-console.log', 'a'
-        ) as f:
-            success, error = '', ''
-            try:
-                output = iocage_lib.ioc_exec.SilentExec(
-                    ['setfib', self.exec_fib, 'jexec', f'ioc-{self.uuid}']
-                    + exec_start, None, unjailed=True, decode=True
-                )
-                if self.get('rtsold') or 'accept_rtadv' in self.ip6_addr:
-                    # rtsold(8) does not start even with rtsold_enable
-                    try:
-                        iocage_lib.ioc_exec.SilentExec(
-                            [
-                                'setfib', self.exec_fib, 'jexec',
-                                f'ioc-{self.uuid}', 'service', 'rtsold',
-                                'start'
-                            ], None, unjailed=True
-                        )
-                    except ioc_exceptions.CommandFailed:
-                        pass
-            except ioc_exceptions.CommandFailed as e:
+        fd = os.open(
+            f'{self.iocroot}/log/{self.uuid}-console.log',
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+        success, error = '', ''
+        try:
+            output = iocage_lib.ioc_exec.SilentExec(
+                ['setfib', self.exec_fib, 'jexec', self.jail_name]
+                + exec_start, None, unjailed=True, decode=True
+            )
+            if self.get('rtsold') or 'accept_rtadv' in self.ip6_addr:
+                # rtsold(8) does not start even with rtsold_enable
+                try:
+                    iocage_lib.ioc_exec.SilentExec(
+                        [
+                            'setfib', self.exec_fib, 'jexec',
+                            self.jail_name, 'service', 'rtsold',
+                            'start'
+                        ], None, unjailed=True
+                    )
+                except ioc_exceptions.CommandFailed:
+                    pass
+        except ioc_exceptions.CommandFailed as e:
 
-                error = str(e)
-                iocage_lib.ioc_stop.IOCStop(
-                    self.uuid, self.path, force=True, silent=True
-                )
+            error = str(e)
+            iocage_lib.ioc_stop.IOCStop(
+                self.uuid, self.path, force=True, silent=True
+            )
 
-                msg = f'  + Starting services FAILED\nERROR:\n{error}\n\n' \
-                    f'Refusing to start {self.uuid}: exec_start failed'
-                iocage_lib.ioc_common.logit({
-                    'level': 'EXCEPTION',
-                    'message': msg
-                },
-                    _callback=self.callback,
-                    silent=self.silent
-                )
-            else:
-                success = output.stdout
-                msg = '  + Starting services OK'
-                iocage_lib.ioc_common.logit({
-                    'level': 'INFO',
-                    'message': msg
-                },
-                    _callback=self.callback,
-                    silent=self.silent
-                )
-            finally:
-                f.write(f'{success}\n{error}')
+            msg = f'  + Starting services FAILED\nERROR:\n{error}\n\n' \
+                f'Refusing to start {self.uuid}: exec_start failed'
+            iocage_lib.ioc_common.logit({
+                'level': 'EXCEPTION',
+                'message': msg
+            },
+                _callback=self.callback,
+                silent=self.silent
+            )
+        else:
+            success = output.stdout
+            msg = '  + Starting services OK'
+            iocage_lib.ioc_common.logit({
+                'level': 'INFO',
+                'message': msg
+            },
+                _callback=self.callback,
+                silent=self.silent
+            )
+        finally:
+            os.write(fd, f'{success}\n{error}'.encode())
+            os.close(fd)
 
         # Running exec_poststart now
         poststart_success, poststart_error = \
@@ -888,36 +1042,31 @@ class IOCStart(object):
                 silent=self.silent
             )
 
-        if not vnet_err and vnet and wants_dhcp:
+        if not vnet_err and vnet and self.wants_dhcp:
             failed_dhcp = False
 
             try:
-                interface = self.conf['interfaces'].split(',')[0].split(
+                interface = c['interfaces'].split(',')[0].split(
                     ':')[0]
 
                 if 'vnet' in interface:
                     # Jails default is epairNb
                     interface = f'{interface.replace("vnet", "epair")}b'
 
-                # We'd like to use ifconfig -f inet:cidr here,
-                # but only FreeBSD 11.0 and newer support it...
-                cmd = ['jexec', f'ioc-{self.uuid}', 'ifconfig',
-                       interface, 'inet']
-                out = su.check_output(cmd)
-
-                # ...so we extract the ip4 address and mask,
-                # and calculate cidr manually
-                addr_split = out.splitlines()[2].split()
-                self.ip4_addr = addr_split[1].decode()
-                hexmask = addr_split[3].decode()
-                maskcidr = sum([bin(int(hexmask, 16)).count('1')])
+                cmd = ['jexec', self.jail_name, 'ifconfig', '-f',
+                       'inet:cidr', interface, 'inet']
+                out = su.check_output(cmd, universal_newlines=True)
+                inet = iocage_lib.ioc_common.INET_ADDRESS_RE.search(out)
+            except su.CalledProcessError:
+                inet = None
 
-                addr = f'{self.ip4_addr}/{maskcidr}'
+            if inet:
+                addr = inet.group(1)
+                self.ip4_addr = addr.split('/')[0]
 
                 if '0.0.0.0' in addr:
                     failed_dhcp = True
-
-            except (su.CalledProcessError, IndexError):
+            else:
                 failed_dhcp = True
                 addr = 'ERROR, check jail logs'
 
@@ -947,12 +1096,11 @@ class IOCStart(object):
             )
         )
 
-        rctl_keys = set(
-            filter(
-                lambda k: self.conf.get(k, 'off') != 'off',
-                iocage_lib.ioc_json.IOCRCTL.types
-            )
-        )
+        conf_get = c.get
+        rctl_keys = [
+            k for k in iocage_lib.ioc_json.IOCRCTL.types
+            if conf_get(k, 'off') != 'off'
+        ]
         if rctl_keys:
 
             # We should remove any rules specified for this jail for just in
@@ -969,7 +1117,7 @@ class IOCStart(object):
             })
 
             failed = rctl_jail.set_rctl_rules(
-                [(k, self.conf[k]) for k in rctl_keys]
+                [(k, c[k]) for k in rctl_keys]
             )
 
             if failed:
@@ -979,7 +1127,7 @@ class IOCStart(object):
                     'RCTL props'
                 })
 
-        cpuset = self.conf.get('cpuset', 'off')
+        cpuset = c.get('cpuset', 'off')
         if cpuset != 'off':
             # Let's set the specified rules
             iocage_lib.ioc_common.logit({
@@ -1003,29 +1151,34 @@ class IOCStart(object):
         default interface to the ips and return the new list
         """
 
+        _ip_addrs = ip_addrs.split(',')
+        if all('|' in ip for ip in _ip_addrs):
+            # Every address already specifies its interface
+            return ip_addrs
+
         inet_mode = netifaces.AF_INET if mode == '4' else netifaces.AF_INET6
-        gws = netifaces.gateways()
 
-        try:
-            def_iface = gws['default'][inet_mode][1]
-        except KeyError:
+        # The default routes were already read for this start
+        def_iface = self.host_gateways[f'ipv{mode}']['interface']
+        if not def_iface:
             # They have no default gateway for mode 4|6
             return ip_addrs
 
-        _ip_addrs = ip_addrs.split(',')
         interfaces_to_skip = ('vnet', 'bridge', 'epair', 'pflog')
-        current_ips = []
         new_ips = []
 
         # We want to make sure they haven't already created
         # this alias
-        for interface in netifaces.interfaces():
-            if interface.startswith(interfaces_to_skip):
-                continue
-
-            with ioc_exceptions.ignore_exceptions(KeyError):
-                for address in netifaces.ifaddresses(interface)[inet_mode]:
-                    current_ips.append(address['addr'])
+        current_ips = self.host_ips.get(mode)
+        if current_ips is None:
+            current_ips = self.host_ips[mode] = {
+                address['addr']
+                for interface in self.host_interface_names
+                if not interface.startswith(interfaces_to_skip)
+                for address in self.host_interface_addresses(
+                    interface
+                ).get(inet_mode, [])
+            }
 
         for ip in _ip_addrs:
             if '|' not in ip:
@@ -1051,13 +1204,13 @@ class IOCStart(object):
         net_configs = (
             (self.ip4_addr, self.defaultrouter, False),
             (self.ip6_addr, self.defaultrouter6, True))
-        nics = self.get("interfaces").split(",")
+        nics = self.conf['interfaces'].split(',')
 
-        vnet_default_interface = self.get('vnet_default_interface')
+        vnet_default_interface = self.conf['vnet_default_interface']
         if (
                 vnet_default_interface != 'auto'
                 and vnet_default_interface != 'none'
-                and vnet_default_interface not in netifaces.interfaces()
+                and vnet_default_interface not in self.host_interface_names
         ):
             # Let's not go into starting a vnet at all if the default
             # interface is supplied incorrectly
@@ -1066,21 +1219,19 @@ class IOCStart(object):
                 'valid interface e.g "lagg0"'
             ]
 
-        for nic in nics:
-            err = self.start_network_interface_vnet(nic, net_configs, jid, nat)
-
-            if err:
-                errors.extend(err)
+        err = self.start_network_interface_vnet(
+            self.conf['interfaces'], net_configs, jid, nat
+        )
+        if err:
+            errors.extend(err)
 
         if not errors:
             # There have been no errors reported for any interface
             # Let's setup default route as specified
-            dhcp = self.get('dhcp')
-            wants_dhcp = dhcp or 'DHCP' in self.ip4_addr.upper()
             skip_accepts_rtadv = 'accept_rtadv' not in self.ip6_addr.lower()
             for ip, default_route, ipv6 in map(lambda v: v[1], filter(
                 lambda v: v[0] and v[1][0] != 'none' and v[1][1] != 'none',
-                zip((not wants_dhcp, skip_accepts_rtadv), net_configs)
+                zip((not self.wants_dhcp, skip_accepts_rtadv), net_configs)
             )):
                 # TODO: Scope/zone id should be investigated further
                 #  to make sure no case is missed wrt this
@@ -1108,13 +1259,13 @@ class IOCStart(object):
                     default_route = f'{default_route.split("%")[0]}' \
                         f'%{default_gw.replace("vnet", "epair")}b'
 
-                self.log.debug(f'Setting default route {default_route}')
+                self.log.debug('Setting default route %s', default_route)
 
                 try:
                     iocage_lib.ioc_common.checkoutput(
                         [
                             'setfib', self.exec_fib, 'jexec',
-                            f'ioc-{self.uuid}',
+                            self.jail_name,
                             'route'
                         ] + list(
                             filter(
@@ -1142,65 +1293,80 @@ class IOCStart(object):
         :param net_configs: Tuple of IP address and router pairs
         :param jid: The jails ID
         """
-        errors = []
-
         nic_defs = nic_defs.split(",")
-        nics = list(map(lambda x: x.split(":")[0], nic_defs))
 
-        for nic_def in nic_defs:
-
-            nic, bridge = nic_def.split(":")
-
-            try:
-                if self.get(f"{nic}_mtu") != 'auto':
-                    membermtu = self.get(f"{nic}_mtu")
-                elif not nat_addr:
-                    membermtu = self.find_bridge_mtu(bridge)
-                else:
-                    membermtu = self.get('vnet_default_mtu')
+        # NICs are independent of each other, most of the time is spent
+        # waiting on ifconfig so bring them up concurrently.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as exc:
+            results = exc.map(
+                lambda nic_def: self.__start_network_vnet_nic__(
+                    nic_def, net_configs, jid, nat_addr
+                ), nic_defs
+            )
+            errors = [err for nic_errors in results for err in nic_errors]
 
-                dhcp = self.get('dhcp')
+        if len(errors) != 0:
+            return errors
 
-                ifaces = []
+    def __start_network_vnet_nic__(
+        self, nic_def, net_configs, jid, nat_addr=0
+    ):
+        """
+        Create a single VNET interface and assign its addresses.
 
-                for addrs, gw, ipv6 in net_configs:
-                    if (
-                        dhcp or 'DHCP' in self.ip4_addr.upper()
-                    ) and 'accept_rtadv' not in addrs:
-                        # Spoofing IP address, it doesn't matter with DHCP
-                        addrs = f"{nic}|''"
+        :return: A list of errors, empty if there were none
+        """
+        errors = []
+        nic, bridge = nic_def.split(":")
 
-                    if addrs == 'none':
-                        continue
+        try:
+            membermtu = self.get(f'{nic}_mtu')
+            if membermtu == 'auto':
+                if nat_addr:
+                    membermtu = self.conf['vnet_default_mtu']
+                else:
+                    with self.network_lock:
+                        membermtu = self.find_bridge_mtu(bridge)
 
-                    for addr in addrs.split(','):
-                        try:
-                            iface, ip = addr.split("|")
-                        except ValueError:
-                            # They didn't supply an interface, assuming default
-                            iface, ip = "vnet0", addr
+            ifaces = set()
 
-                        if iface not in nics:
-                            continue
+            for addrs, gw, ipv6 in net_configs:
+                if self.wants_dhcp and 'accept_rtadv' not in addrs:
+                    # Spoofing IP address, it doesn't matter with DHCP
+                    addrs = f"{nic}|''"
 
-                        if iface not in ifaces:
-                            err = self.start_network_vnet_iface(
-                                nic, bridge, membermtu, jid, nat_addr
-                            )
-                            if err:
-                                errors.append(err)
+                if addrs == 'none':
+                    continue
 
-                            ifaces.append(iface)
+                for addr in addrs.split(','):
+                    try:
+                        iface, ip = addr.split("|")
+                    except ValueError:
+                        # They didn't supply an interface, assuming default
+                        iface, ip = "vnet0", addr
+
+                    if iface != nic:
+                        # Addresses of other NICs are set up by their own
+                        # call
+                        continue
 
-                        err = self.start_network_vnet_addr(iface, ip, gw, ipv6)
+                    if iface not in ifaces:
+                        err = self.start_network_vnet_iface(
+                            nic, bridge, membermtu, jid, nat_addr
+                        )
                         if err:
                             errors.append(err)
 
-            except su.CalledProcessError as err:
-                errors.append(err.output.decode("utf-8").rstrip())
+                        ifaces.add(iface)
 
-        if len(errors) != 0:
-            return errors
+                    err = self.start_network_vnet_addr(iface, ip, gw, ipv6)
+                    if err:
+                        errors.append(err)
+
+        except su.CalledProcessError as err:
+            errors.append(err.output.decode("utf-8").rstrip())
+
+        return errors
 
     def start_network_vnet_iface(self, nic, bridge, mtu, jid, nat_addr=0):
         """
@@ -1212,15 +1378,7 @@ class IOCStart(object):
         :param jid: The jails ID
         :return: If an error occurs it returns the error. Otherwise, it's None
         """
-        vnet_default_interface = self.get('vnet_default_interface')
-        if vnet_default_interface == 'auto':
-            vnet_default_interface = self.get_default_interface()
-
-        mac_a, mac_b = self.__start_generate_vnet_mac__(nic)
-        epair_a_cmd = ["ifconfig", "epair", "create"]
-        epair_a = su.Popen(epair_a_cmd, stdout=su.PIPE).communicate()[0]
-        epair_a = epair_a.decode().strip()
-        epair_b = re.sub("a$", "b", epair_a)
+        vnet_default_interface = self.vnet_default_interface
 
         if 'vnet' in nic:
             # Inside jails they are epairN
@@ -1229,92 +1387,94 @@ class IOCStart(object):
             jail_nic = nic
 
         try:
-            # Host
-            iocage_lib.ioc_common.checkoutput(
-                [
-                    "ifconfig", epair_a, "name",
-                    f"{nic}.{jid}", "mtu", mtu
-                ],
-                stderr=su.STDOUT
-            )
-            iocage_lib.ioc_common.checkoutput(
-                ["ifconfig", f"{nic}.{jid}", "link", mac_a],
-                stderr=su.STDOUT
-            )
-            iocage_lib.ioc_common.checkoutput(
-                ["ifconfig", f"{nic}.{jid}", "description",
-                 f"associated with jail: {self.uuid} as nic: {jail_nic}"],
-                stderr=su.STDOUT
-            )
+            # Everything up to renaming the jail end is done under the lock,
+            # otherwise the kernel can hand us an epair whose jail end is
+            # named like another NIC's jail end is about to be renamed to.
+            with self.network_lock:
+                mac_a, mac_b = self.__start_generate_vnet_mac__(nic)
+                epair_a_cmd = ["ifconfig", "epair", "create"]
+                epair_a = su.run(
+                    epair_a_cmd, stdout=su.PIPE
+                ).stdout.decode().strip()
+                epair_b = f'{epair_a[:-1]}b'
+
+                # Host, "link" is an address family so it has to follow the
+                # interface directly. ifconfig applies the operations following
+                # "name" to the renamed interface.
+                accept_rtadv = 'accept_rtadv' in self.ip6_addr
+                host_ifconfig = [
+                    "ifconfig", epair_a, "link", mac_a, "name", f"{nic}.{jid}",
+                    "mtu", mtu, "description",
+                    f"associated with jail: {self.uuid} as nic: {jail_nic}"
+                ]
+                if not accept_rtadv:
+                    host_ifconfig.append("up")
 
-            if 'accept_rtadv' in self.ip6_addr:
-                # Set linklocal for IP6 + rtsold
                 iocage_lib.ioc_common.checkoutput(
-                    ['ifconfig', f'{nic}.{jid}', 'inet6', 'auto_linklocal',
-                     'accept_rtadv', 'autoconf'],
-                    stderr=su.STDOUT)
+                    host_ifconfig, stderr=su.STDOUT
+                )
 
-            # Jail
-            iocage_lib.ioc_common.checkoutput(
-                [
-                    "ifconfig", epair_b, "vnet",
-                    f"ioc-{self.uuid}"
-                ],
-                stderr=su.STDOUT
-            )
-            iocage_lib.ioc_common.checkoutput(
-                [
-                    'jexec', f'ioc-{self.uuid}', 'ifconfig', epair_b,
-                    'mtu', mtu
-                ],
-                stderr=su.STDOUT
-            )
+                if accept_rtadv:
+                    # Set linklocal for IP6 + rtsold before bringing it up
+                    iocage_lib.ioc_common.checkoutput(
+                        ['ifconfig', f'{nic}.{jid}', 'inet6', 'auto_linklocal',
+                         'accept_rtadv', 'autoconf', 'up'],
+                        stderr=su.STDOUT)
 
-            if epair_b != jail_nic:
-                # This occurs on default vnet0 ip4_addr's
+                # Jail
                 iocage_lib.ioc_common.checkoutput(
-                    [
-                        "setfib", self.exec_fib, "jexec", f"ioc-{self.uuid}",
-                        "ifconfig", epair_b, "name", jail_nic
-                    ],
+                    ["ifconfig", epair_b, "vnet", self.jail_name],
                     stderr=su.STDOUT
                 )
+                jail_ifconfig = [
+                    "setfib", self.exec_fib, "jexec", self.jail_name,
+                    "ifconfig", epair_b, "link", mac_b, "mtu", mtu
+                ]
 
-            iocage_lib.ioc_common.checkoutput(
-                [
-                    "setfib", self.exec_fib, "jexec", f"ioc-{self.uuid}",
-                    "ifconfig", jail_nic, "link", mac_b
-                ],
-                stderr=su.STDOUT
-            )
-
-            if not nat_addr:
-                try:
-                    # Host interface as supplied by user also needs to be on
-                    # the bridge
-                    if vnet_default_interface != 'none':
-                        iocage_lib.ioc_common.checkoutput(
-                            ['ifconfig', bridge, 'addm',
-                             vnet_default_interface],
-                            stderr=su.STDOUT
-                        )
-                except su.CalledProcessError:
-                    # Already exists
-                    pass
+                if epair_b != jail_nic:
+                    # This occurs on default vnet0 ip4_addr's
+                    jail_ifconfig += ["name", jail_nic]
 
                 iocage_lib.ioc_common.checkoutput(
-                    ['ifconfig', bridge, 'addm', f'{nic}.{jid}', 'up'],
-                    stderr=su.STDOUT
+                    jail_ifconfig, stderr=su.STDOUT
                 )
+
+            if not nat_addr:
+                with self.network_lock:
+                    # Only consult the members find_bridge_mtu already
+                    # listed, otherwise just try adding the interface.
+                    members = self.bridge_members.get(bridge)
+
+                    # Host interface as supplied by user also needs to be
+                    # on the bridge
+                    if vnet_default_interface != 'none' and (
+                        members is None
+                        or vnet_default_interface not in members
+                    ):
+                        try:
+                            iocage_lib.ioc_common.checkoutput(
+                                ['ifconfig', bridge, 'addm',
+                                 vnet_default_interface],
+                                stderr=su.STDOUT
+                            )
+                        except su.CalledProcessError:
+                            # Already a member of this or another bridge
+                            pass
+                        else:
+                            if members is not None:
+                                members.append(vnet_default_interface)
+
+                    iocage_lib.ioc_common.checkoutput(
+                        ['ifconfig', bridge, 'addm', f'{nic}.{jid}', 'up'],
+                        stderr=su.STDOUT
+                    )
+                    if members is not None:
+                        members.append(f'{nic}.{jid}')
             else:
                 iocage_lib.ioc_common.checkoutput(
                     ['ifconfig', f'{nic}.{jid}', 'inet', f'{nat_addr}/30'],
                     stderr=su.STDOUT
                 )
-            iocage_lib.ioc_common.checkoutput(
-                ['ifconfig', f'{nic}.{jid}', 'up'],
-                stderr=su.STDOUT
-            )
         except su.CalledProcessError as err:
             return f"{err.output.decode('utf-8')}".rstrip()
 
@@ -1327,9 +1487,6 @@ class IOCStart(object):
         :param defaultgw: The gateway IP to assign to the nic
         :return: If an error occurs it returns the error. Otherwise, it's None
         """
-        dhcp = self.get('dhcp')
-        wants_dhcp = True if dhcp or 'DHCP' in self.ip4_addr.upper() else False
-
         if 'vnet' in iface:
             # Inside jails they are epairNb
             iface = f'{iface.replace("vnet", "epair")}b'
@@ -1340,10 +1497,10 @@ class IOCStart(object):
             ifconfig = [iface, ip, 'alias']
 
         try:
-            if not wants_dhcp and ip != 'accept_rtadv':
+            if not self.wants_dhcp and ip != 'accept_rtadv':
                 # Jail side
                 iocage_lib.ioc_common.checkoutput(
-                    ['setfib', self.exec_fib, 'jexec', f'ioc-{self.uuid}',
+                    ['setfib', self.exec_fib, 'jexec', self.jail_name,
                      'ifconfig'] + ifconfig, stderr=su.STDOUT)
         except su.CalledProcessError as err:
             return f'{err.output.decode("utf-8")}'.rstrip()
@@ -1357,11 +1514,32 @@ class IOCStart(object):
         if not iocage_lib.ioc_common.check_truthy(host_time):
             return
 
-        if os.path.isfile(file):
-            os.remove(file)
+        try:
+            host_st = os.lstat("/etc/localtime")
+        except FileNotFoundError:
+            return
+
+        try:
+            jail_st = os.lstat(file)
+        except FileNotFoundError:
+            pass
+        else:
+            # Nothing to do if the jail already has the host's zone, copy2
+            # below preserves the mtime we compare against.
+            if stat.S_ISLNK(host_st.st_mode):
+                if stat.S_ISLNK(jail_st.st_mode) and \
+                        os.readlink(file) == os.readlink("/etc/localtime"):
+                    return
+            elif stat.S_ISREG(jail_st.st_mode) and (
+                jail_st.st_size, jail_st.st_mtime_ns
+            ) == (host_st.st_size, host_st.st_mtime_ns):
+                return
+
+            if os.path.isfile(file) or stat.S_ISLNK(jail_st.st_mode):
+                os.remove(file)
 
         try:
-            shutil.copy("/etc/localtime", file, follow_symlinks=False)
+            shutil.copy2("/etc/localtime", file, follow_symlinks=False)
         except FileNotFoundError:
             return
 
@@ -1374,17 +1552,16 @@ class IOCStart(object):
             with iocage_lib.ioc_common.open_atomic(
                     f"{self.path}/root/etc/resolv.conf", "w") as resolv_conf:
 
-                for line in resolver.split(";"):
-                    resolv_conf.write(line + "\n")
+                resolv_conf.write("\n".join(resolver.split(";")) + "\n")
         elif resolver == "none":
-            shutil.copy("/etc/resolv.conf",
-                        f"{self.path}/root/etc/resolv.conf")
+            shutil.copyfile("/etc/resolv.conf",
+                            f"{self.path}/root/etc/resolv.conf")
         elif resolver == "/dev/null":
             # They don't want the resolv.conf to be touched.
 
             return
         else:
-            shutil.copy(resolver, f"{self.path}/root/etc/resolv.conf")
+            shutil.copyfile(resolver, f"{self.path}/root/etc/resolv.conf")
 
     def __generate_mac_bytes(self, nic):
         m = hashlib.md5()
@@ -1396,7 +1573,12 @@ class IOCStart(object):
 
     def __generate_mac_address_pair(self, nic):
         mac_a = self.__generate_mac_bytes(nic)
-        mac_b = hex(int(mac_a, 16) + 1)[2:].zfill(12)
+        # Increment within the suffix so a carry can never spill into
+        # mac_prefix or past 48 bits
+        prefix_len = len(self.get("mac_prefix"))
+        suffix_len = 12 - prefix_len
+        suffix = (int(mac_a[prefix_len:], 16) + 1) % (1 << 4 * suffix_len)
+        mac_b = f'{mac_a[:prefix_len]}{suffix:0{suffix_len}x}'
 
         return mac_a, mac_b
 
@@ -1454,6 +1636,9 @@ class IOCStart(object):
                         )
                     )
                 }
+
+        # Changes for rc.conf, a value of None removes the key
+        changes = {}
         for nic in nics:
             if 'vnet' in nic:
                 # Inside jails they are epairNb
@@ -1462,12 +1647,11 @@ class IOCStart(object):
             key = f'ifconfig_{nic}' if ipv4 else f'ifconfig_{nic}_ipv6'
             value = 'SYNCDHCP' if ipv4 else 'inet6 auto_linklocal accept_rtadv autoconf'
             if enable:
-                cmd = [f'{key}={value}']
-            else:
-                cmd = ['-x', key] if key in entries and entries[key] == value else []
+                changes[key] = value
+            elif key in entries and entries[key] == value:
+                changes[key] = None
 
-            if cmd:
-                su.run(['sysrc', '-f', rc_conf_path] + cmd, stdout=su.PIPE)
+        return changes
 
     def __check_rtsold__(self):
         if 'accept_rtadv' not in self.ip6_addr:
@@ -1481,13 +1665,24 @@ class IOCStart(object):
                 silent=self.silent
             )
 
-        su.run(
-            [
-                'sysrc', '-f', f'{self.path}/root/etc/rc.conf',
-                f'rtsold_enable=YES'
-            ],
-            stdout=su.PIPE
-        )
+        return {'rtsold_enable': 'YES'}
+
+    def __update_rc_conf__(self, changes):
+        """
+        Applies all rc.conf changes with at most one sysrc call for the
+        keys to set and one for the keys to remove.
+        """
+        rc_conf_path = os.path.join(self.path, 'root/etc/rc.conf')
+        assignments = [f'{k}={v}' for k, v in changes.items() if v is not None]
+        removals = [k for k, v in changes.items() if v is None]
+
+        if assignments:
+            su.run(['sysrc', '-f', rc_conf_path] + assignments, stdout=su.PIPE)
+
+        if removals:
+            su.run(
+                ['sysrc', '-f', rc_conf_path, '-x'] + removals, stdout=su.PIPE
+            )
 
     def get_default_interface(self):
         if self.host_gateways['ipv4']['interface']:
@@ -1520,50 +1715,45 @@ class IOCStart(object):
             return 'none'
 
     def get_bridge_members(self, bridge):
-        return [
-            x.split()[1] for x in
-            iocage_lib.ioc_common.checkoutput(
-                ["ifconfig", bridge]
-            ).splitlines()
-            if x.strip().startswith("member")
-        ]
+        return BRIDGE_MEMBER_RE.findall(
+            iocage_lib.ioc_common.checkoutput(["ifconfig", bridge])
+        )
 
     def find_bridge_mtu(self, bridge):
-        if self.unit_test:
-            dhcp = 0
-            wants_dhcp = False
-        else:
-            dhcp = self.get('dhcp')
-            wants_dhcp = True if dhcp or 'DHCP' in self.ip4_addr.upper() else \
-                False
+        # NICs sharing a bridge share its MTU, only ask ifconfig once
+        if bridge in self.bridge_mtus:
+            return self.bridge_mtus[bridge]
 
         try:
-            if wants_dhcp:
+            if self.wants_dhcp:
                 # Let's get the default vnet interface
-                default_if = self.get('vnet_default_interface')
-                if default_if == 'auto':
-                    default_if = self.get_default_interface()
-
+                default_if = self.vnet_default_interface
                 if default_if != 'none':
                     bridge_cmd = [
                         "ifconfig", bridge, "create", "addm", default_if
                     ]
-                    su.check_call(bridge_cmd, stdout=su.PIPE, stderr=su.PIPE)
+                    su.check_call(
+                        bridge_cmd, stdout=su.DEVNULL, stderr=su.DEVNULL
+                    )
 
             else:
                 bridge_cmd = ["ifconfig", bridge, "create", "addm"]
-                su.check_call(bridge_cmd, stdout=su.PIPE, stderr=su.PIPE)
+                su.check_call(
+                    bridge_cmd, stdout=su.DEVNULL, stderr=su.DEVNULL
+                )
         except su.CalledProcessError:
             # The bridge already exists, this is just best effort.
             pass
 
-        memberif = self.get_bridge_members(bridge)
+        memberif = self.bridge_members[bridge] = \
+            self.get_bridge_members(bridge)
         if not memberif:
             return self.get('vnet_default_mtu')
 
         membermtu = iocage_lib.ioc_common.checkoutput(
             ["ifconfig", memberif[0]]
         ).split()
+        self.bridge_mtus[bridge] = membermtu[5]
 
         return membermtu[5]
 
@@ -1625,7 +1815,7 @@ class IOCStart(object):
             pf = su.run(
                 ['pfctl', '-f', pf_conf], stdout=su.PIPE, stderr=su.PIPE
             )
-            self.log.debug(f'pfctl -f {pf_conf} ran')
+            self.log.debug('pfctl -f %s ran', pf_conf)
 
             if pf.returncode != 0:
                 iocage_lib.ioc_common.logit({
@@ -1637,12 +1827,12 @@ class IOCStart(object):
 
         else:
             su.run(['ifconfig', nat_interface, '-tso4', '-lro', '-vlanhwtso'])
-            self.log.debug(f'TSO, LRO, VLANHWTSO disabled on {nat_interface}')
+            self.log.debug('TSO, LRO, VLANHWTSO disabled on %s', nat_interface)
             ipfw_conf = self.__add_nat_ipfw__(nat_interface, forwards)
             ipfw = su.run(
                 ['sh', '-c', ipfw_conf], stdout=su.PIPE, stderr=su.PIPE
             )
-            self.log.debug(f'{ipfw_conf} ran')
+            self.log.debug('%s ran', ipfw_conf)
 
             if ipfw.returncode != 0:
                 iocage_lib.ioc_common.logit({
@@ -1662,7 +1852,7 @@ class IOCStart(object):
             f'nat on {nat_interface} from {nat_network} to any ->'
             f' ({nat_interface}:0) static-port'
         ]
-        self.log.debug(f'Initial Rule: {rules[0]}')
+        self.log.debug('Initial Rule: %s', rules[0])
         rdrs = []
 
         if forwards != 'none':
@@ -1676,10 +1866,10 @@ class IOCStart(object):
                     f' to ({nat_interface}:0) port {map} -> {ip4_addr}'
                     f' port {port}\n'
                 )
-        self.log.debug(f'Forwards: {rdrs}')
+        self.log.debug('Forwards: %s', rdrs)
 
         with open(os.open(pf_conf, os.O_CREAT | os.O_RDWR), 'w+') as f:
-            self.log.debug(f'{pf_conf} opened')
+            self.log.debug('%s opened', pf_conf)
             for line in f.readlines():
                 line = line.rstrip()
                 if line.startswith('rdr') and ip4_addr not in line:
@@ -1688,10 +1878,10 @@ class IOCStart(object):
             f.seek(0)
             for rule in rules:
                 f.write(f'{rule}\n')
-                self.log.debug(f'Wrote: {rule}')
+                self.log.debug('Wrote: %s', rule)
             for rdr in rdrs:
                 f.write(rdr)
-                self.log.debug(f'Wrote: {rdr}')
+                self.log.debug('Wrote: %s', rdr)
             f.truncate()
 
         os.chmod(pf_conf, 0o755)
@@ -1701,7 +1891,7 @@ class IOCStart(object):
     def __add_nat_ipfw__(self, nat_interface, forwards):
         ipfw_conf = '/tmp/iocage_nat_ipfw.conf'
         nat_rule = f'ipfw -q nat 462 config if {nat_interface} same_ports'
-        self.log.debug(f'Initial rule: {nat_rule}')
+        self.log.debug('Initial rule: %s', nat_rule)
         rdrs = ''
         ip4_addr = self.ip4_addr.split('|')[1].rsplit('/')[0]
         nat_network = str(
@@ -1714,14 +1904,14 @@ class IOCStart(object):
             'ipfw -q add 101 nat 462 ip4 from any to any in via'
             f' {nat_interface}'
         ]
-        self.log.debug(f'Rules: {rules}')
+        self.log.debug('Rules: %s', rules)
 
         if forwards != 'none':
             for proto, port, map in self.__parse_nat_fwds__(forwards):
                 rdrs += f' redirect_port {proto} {ip4_addr}:{port} {map}'
 
         with open(os.open(ipfw_conf, os.O_CREAT | os.O_RDWR), 'w+') as f:
-            self.log.debug(f'{ipfw_conf} opened')
+            self.log.debug('%s opened', ipfw_conf)
             for line in f.readlines():
                 line = line.rstrip()
                 if line not in rules and nat_rule in line:
@@ -1737,7 +1927,8 @@ class IOCStart(object):
 
                     rules.insert(1, f'{final_line}{rdrs}')
                     self.log.debug(
-                        f'Inserted: {final_line}{rdrs} into rules at index 1'
+                        'Inserted: %s%s into rules at index 1',
+                        final_line, rdrs
                     )
 
             if rules[1].endswith(nat_interface):
@@ -1746,12 +1937,12 @@ class IOCStart(object):
                     nat_rule += rdrs
 
                 rules.insert(1, nat_rule)
-                self.log.debug(f'Inserted: {nat_rule} into rules at index 1')
+                self.log.debug('Inserted: %s into rules at index 1', nat_rule)
 
             f.seek(0)
             for rule in rules:
                 f.write(f'{rule}\n')
-                self.log.debug(f'Wrote: {rule}')
+                self.log.debug('Wrote: %s', rule)
             f.truncate()
 
         os.chmod(ipfw_conf, 0o755)
@@ -1759,17 +1950,17 @@ class IOCStart(object):
         return ipfw_conf
 
     def __parse_nat_fwds__(self, forwards):
-        self.log.debug(f'Parsing NAT forwards: {forwards}')
+        self.log.debug('Parsing NAT forwards: %s', forwards)
 
         for fwd in forwards.split(','):
             proto, port = fwd.split('(')
             port = port.strip('()')
 
-            self.log.debug(f'Proto: {proto} Port: {port}')
+            self.log.debug('Proto: %s Port: %s', proto, port)
             try:
                 port, map = port.rsplit(':', 1)
             except ValueError:
                 map = port
-            self.log.debug(f'Mapping {port} to {map}')
+            self.log.debug('Mapping %s to %s', port, map)
 
             yield proto, port, map
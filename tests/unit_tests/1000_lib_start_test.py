@@ -22,7 +22,10 @@
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 import mock
+import netifaces
+import os
 import pytest
+import threading
 import iocage_lib.ioc_start as ioc_start
 
 
@@ -141,6 +144,212 @@ def test_should_return_default_gateway(test_input, expected):
     assert iocstart.get_default_gateway('ipv6') == expected['ipv6']
 
 
+@mock.patch('iocage_lib.ioc_start.su.run')
+@mock.patch('iocage_lib.ioc_common.checkoutput')
+def test_should_start_each_vnet_nic_once(mock_checkoutput, mock_run):
+    mock_checkoutput.return_value = ''
+    epairs = iter(['epair3a\n', 'epair4a\n'])
+    epairs_lock = threading.Lock()
+
+    def _epair_create(cmd, **kwargs):
+        assert cmd == ['ifconfig', 'epair', 'create']
+        with epairs_lock:
+            return mock.Mock(stdout=next(epairs).encode())
+
+    mock_run.side_effect = _epair_create
+
+    iocs = ioc_start.IOCStart('jail', '', unit_test=True)
+    iocs.exec_fib = '0'
+    iocs.conf = {
+        'vnet_default_interface': 'none',
+        'vnet0_mtu': '1500',
+        'vnet1_mtu': '1500',
+        'vnet0_mac': '02ff60000000 02ff60000001',
+        'vnet1_mac': '02ff60000002 02ff60000003',
+    }
+    errors = iocs.start_network_interface_vnet(
+        'vnet0:bridge0,vnet1:bridge1',
+        (('vnet0|10.0.0.2/24,vnet1|10.0.1.2/24', 'none', False),
+         ('none', 'none', True)),
+        5
+    )
+    assert errors is None
+    assert mock_run.call_count == 2
+
+    calls = [c[0][0] for c in mock_checkoutput.call_args_list]
+    host_names = sorted(c[5] for c in calls if c[:1] == ['ifconfig']
+                        and 'name' in c)
+    assert host_names == ['vnet0.5', 'vnet1.5']
+    jail_names = sorted(c[-1] for c in calls if c[:1] == ['setfib']
+                        and 'name' in c)
+    assert jail_names == ['epair0b', 'epair1b']
+    for nic, bridge in (('vnet0', 'bridge0'), ('vnet1', 'bridge1')):
+        assert ['ifconfig', bridge, 'addm', f'{nic}.5', 'up'] in calls
+        # MTUs are configured, so there is no need to list bridge members
+        assert ['ifconfig', bridge] not in calls
+    assert ['setfib', '0', 'jexec', 'ioc-jail', 'ifconfig', 'epair0b',
+            '10.0.0.2/24', 'alias'] in calls
+    assert ['setfib', '0', 'jexec', 'ioc-jail', 'ifconfig', 'epair1b',
+            '10.0.1.2/24', 'alias'] in calls
+
+
+@mock.patch('iocage_lib.ioc_start.su.run')
+@mock.patch('iocage_lib.ioc_common.checkoutput')
+def test_should_add_epair_when_default_interface_is_bridged_elsewhere(
+    mock_checkoutput, mock_run
+):
+    def _checkoutput(cmd, **kwargs):
+        if cmd == ['ifconfig', 'bridge1', 'addm', 'em0']:
+            raise ioc_start.su.CalledProcessError(1, cmd, b'File exists')
+        return ''
+
+    mock_checkoutput.side_effect = _checkoutput
+    mock_run.return_value = mock.Mock(stdout=b'epair3a\n')
+
+    iocs = ioc_start.IOCStart('jail', '', unit_test=True)
+    iocs.exec_fib = '0'
+    iocs.conf = {
+        'vnet_default_interface': 'em0',
+        'vnet1_mac': '02ff60000002 02ff60000003',
+    }
+    err = iocs.start_network_vnet_iface('vnet1', 'bridge1', '1500', 5)
+    assert err is None
+    mock_checkoutput.assert_any_call(
+        ['ifconfig', 'bridge1', 'addm', 'vnet1.5', 'up'],
+        stderr=ioc_start.su.STDOUT
+    )
+
+
+@pytest.mark.parametrize('suffix,expected', [
+    ('000000', '02ff60000001'),
+    ('00ffff', '02ff60010000'),
+    ('ffffff', '02ff60000000'),
+])
+def test_should_keep_mac_prefix_for_jail_side_mac(suffix, expected):
+    iocs = ioc_start.IOCStart('jail', '', unit_test=True)
+    iocs.conf = {'mac_prefix': '02ff60'}
+    with mock.patch.object(
+        iocs, '_IOCStart__generate_mac_bytes',
+        return_value=f'02ff60{suffix}'
+    ):
+        mac_a, mac_b = iocs._IOCStart__generate_mac_address_pair('vnet0')
+
+    assert mac_a == f'02ff60{suffix}'
+    assert mac_b == expected
+    assert len(mac_b) == 12
+
+
+def test_should_only_enable_jail_parameters_set_to_one():
+    assert ioc_start.enabled_jail_parameters([
+        ('allow.mount', 1),
+        ('allow.mount.zfs', '1'),
+        ('allow.vmm', '10'),
+        ('allow.mlock', 0),
+        ('mount.fdescfs', '0'),
+        None,
+    ]) == ['allow.mount=1', 'allow.mount.zfs=1']
+
+
+@mock.patch('iocage_lib.ioc_start.su.run')
+def test_should_update_rc_conf_with_one_call_per_operation(mock_run):
+    iocs = ioc_start.IOCStart('jail', '/jails/jail', unit_test=True)
+    iocs.__update_rc_conf__({
+        'ifconfig_epair0b': 'SYNCDHCP',
+        'ifconfig_epair1b': None,
+        'rtsold_enable': 'YES',
+        'ifconfig_epair1b_ipv6': None,
+    })
+    assert mock_run.call_args_list == [
+        mock.call(['sysrc', '-f', '/jails/jail/root/etc/rc.conf',
+                   'ifconfig_epair0b=SYNCDHCP', 'rtsold_enable=YES'],
+                  stdout=ioc_start.su.PIPE),
+        mock.call(['sysrc', '-f', '/jails/jail/root/etc/rc.conf', '-x',
+                   'ifconfig_epair1b', 'ifconfig_epair1b_ipv6'],
+                  stdout=ioc_start.su.PIPE),
+    ]
+
+
+@mock.patch('iocage_lib.ioc_start.su.run')
+def test_should_not_run_sysrc_without_rc_conf_changes(mock_run):
+    iocs = ioc_start.IOCStart('jail', '/jails/jail', unit_test=True)
+    iocs.__update_rc_conf__({})
+    mock_run.assert_not_called()
+
+
+def test_should_reload_plugin_manifest_only_when_modified(tmp_path):
+    manifest = tmp_path / 'plugin.json'
+    manifest.write_text('{"name": "first"}')
+    os.utime(manifest, (1000, 1000))
+
+    first = ioc_start.load_plugin_manifest(str(manifest))
+    assert first == {'name': 'first'}
+    assert ioc_start.load_plugin_manifest(str(manifest)) is first
+
+    manifest.write_text('{"name": "second"}')
+    os.utime(manifest, (2000, 2000))
+    assert ioc_start.load_plugin_manifest(str(manifest)) == {
+        'name': 'second'
+    }
+
+
+host_addresses = {
+    'em0': {netifaces.AF_INET: [{'addr': '10.0.0.5'}],
+            netifaces.AF_INET6: [{'addr': 'fd00::5'}]},
+    'lo0': {netifaces.AF_INET: [{'addr': '127.0.0.1'}]},
+    'vnet0.3': {netifaces.AF_INET: [{'addr': '10.0.0.9'}]},
+}
+
+
+def aliases_iocstart(ipv4_interface='em0', ipv6_interface='em0'):
+    iocs = ioc_start.IOCStart('jail', '', unit_test=True)
+    iocs.host_gateways = {
+        'ipv4': {'gateway': None, 'interface': ipv4_interface},
+        'ipv6': {'gateway': None, 'interface': ipv6_interface},
+    }
+    return iocs
+
+
+@mock.patch('netifaces.ifaddresses', side_effect=host_addresses.get)
+@mock.patch('netifaces.interfaces', return_value=list(host_addresses))
+def test_should_resolve_aliases_from_one_host_snapshot(
+    mock_interfaces, mock_ifaddresses
+):
+    iocs = aliases_iocstart()
+    assert iocs.check_aliases('10.0.0.5,10.0.0.9') == \
+        '10.0.0.5,em0|10.0.0.9'
+    assert iocs.check_aliases('10.0.0.5,10.0.0.7') == \
+        '10.0.0.5,em0|10.0.0.7'
+
+    mock_interfaces.assert_called_once_with()
+    assert sorted(c[0][0] for c in mock_ifaddresses.call_args_list) == \
+        ['em0', 'lo0']
+
+
+@mock.patch('netifaces.ifaddresses')
+@mock.patch('netifaces.interfaces')
+def test_should_leave_aliases_with_interfaces_alone(
+    mock_interfaces, mock_ifaddresses
+):
+    iocs = aliases_iocstart()
+    assert iocs.check_aliases('em0|10.0.0.7,lo0|127.0.1.1') == \
+        'em0|10.0.0.7,lo0|127.0.1.1'
+    mock_interfaces.assert_not_called()
+    mock_ifaddresses.assert_not_called()
+
+
+@mock.patch('netifaces.ifaddresses', side_effect=host_addresses.get)
+@mock.patch('netifaces.interfaces', return_value=list(host_addresses))
+@mock.patch('netifaces.gateways')
+def test_should_take_alias_interface_from_host_gateways(
+    mock_gateways, mock_interfaces, mock_ifaddresses
+):
+    iocs = aliases_iocstart(ipv4_interface=None, ipv6_interface='lo0')
+    # No IPv4 default route, nothing to resolve against
+    assert iocs.check_aliases('10.0.0.7') == '10.0.0.7'
+    assert iocs.check_aliases('fd00::5,fd00::7', '6') == 'fd00::5,lo0|fd00::7'
+    mock_gateways.assert_not_called()
+
+
 bridge_if_config = """bridge0: flags=8843<UP,BROADCAST,RUNNING,SIMPLEX,MULTICAST> metric 0 mtu 1500
         ether 00:00:00:00:00:00
         nd6 options=1<PERFORMNUD>
@@ -0,0 +1,61 @@
+# Copyright (c) 2014-2019, iocage
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted providing that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ``AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED.  IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS
+# OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from unittest.mock import patch
+
+import netifaces
+import pytest
+
+from iocage_lib.ioc_json import IOCConfiguration
+
+
+@pytest.mark.parametrize('mac_prefix,expected', [
+    ('02ff60', True),
+    ('aeff60', True),
+    ('03ff60', False),
+    ('00ff60', False),
+    ('01ff60', False),
+    ('02ff6', False),
+])
+def test_01_validate_mac_prefix(mac_prefix, expected):
+    assert IOCConfiguration.validate_mac_prefix(mac_prefix) is expected
+
+
+@pytest.mark.parametrize('host_mac,expected', [
+    ('02:aa:bb:cc:dd:ee', '02aabb'),
+    ('01:23:45:67:89:ab', '022345'),
+    ('00:0d:b9:33:87:16', '020db9'),
+    ('ff:ff:ff:00:00:00', 'feffff'),
+])
+def test_02_mac_prefix_from_host(host_mac, expected):
+    with patch(
+        'netifaces.gateways',
+        return_value={'default': {netifaces.AF_INET: ('10.0.0.1', 'em0')}}
+    ), patch(
+        'netifaces.ifaddresses',
+        return_value={netifaces.AF_LINK: [{'addr': host_mac}]}
+    ):
+        mac_prefix = IOCConfiguration.get_mac_prefix()
+
+    assert mac_prefix == expected
+    assert IOCConfiguration.validate_mac_prefix(mac_prefix)